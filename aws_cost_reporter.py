@@ -6,7 +6,7 @@ Author  : Santanu Das (@dsantanu) | License : MIT
 Version : v1.1.0
 
 Usage:
-  python aws_cost_report.py --input ./audit_dir --output ./report.docx [--charts] [--org "My Company"] [--author "Your Name (Role)"]
+  python aws_cost_report.py --input ./audit_dir --output ./report.docx [--charts] [--cache] [--emit-parquet] [--org "My Company"] [--author "Your Name (Role)"]
 
 Notes:
 - Expects (where available) files like:
@@ -14,9 +14,16 @@ Notes:
   s3-<bucket>-size.json, rds.json, loadbalancers.json, nat-gateways.json, tags.json,
   route53-cost.json, route53-zones.json, route53-health-checks.json,
   route53-records-*.json, elastic-ips.json, eip-cost.json
+- With --cache (needs pyarrow), parsed data is cached as .cache_<hash>_*.parquet in the
+  audit directory and reused until any of its JSON files change. Off by default, so the
+  audit pack (archived by aws-cost-audit.sh) stays free of cache files.
+  EC2/EBS/RDS frames also use Arrow-backed dtypes (pyarrow>=10).
 """
 
-import argparse, json, re, sys
+import argparse, hashlib, importlib.util, json, mmap, os, re, stat, sys
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from statistics import mean
@@ -26,132 +33,261 @@ from docx import Document
 from docx.shared import Inches, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+from xml.sax.saxutils import escape
 
-# Optional charts
+# Optional fast JSON decoder (orjson -> ujson -> stdlib json)
 try:
-    import matplotlib.pyplot as plt
-    MATPLOTLIB_OK = True
+    import orjson as jsonlib
 except Exception:
-    MATPLOTLIB_OK = False
+    try:
+        import ujson as jsonlib
+    except Exception:
+        jsonlib = json
+# orjson also parses from a memoryview, so large files can be mapped instead of read into bytes
+JSON_MMAP_OK = jsonlib.__name__ == "orjson"
+JSON_MMAP_MIN_BYTES = 10_000_000
+
+# Optional streaming parser for large Route 53 record dumps
+try:
+    import ijson
+    IJSON_OK = True
+except Exception:
+    IJSON_OK = False
+
+# Optional Parquet cache for parsed audit data
+try:
+    import pyarrow
+    PYARROW_OK = True
+except Exception:
+    PYARROW_OK = False
+
+# Optional charts: only probed here; matplotlib is imported on first use (see chart_figure)
+MATPLOTLIB_OK = importlib.util.find_spec("matplotlib") is not None
 
 AWS_ORANGE = "#FF9900"
 AWS_BLUE   = "#0073BB"
 AWS_GRAY   = "#232F3E"
 AWS_PALETTE = [AWS_ORANGE, AWS_BLUE, AWS_GRAY, "#A6ACAF", "#D5DBDB"]
 
+# PNG resolution for embedded charts; ample for a 5.5in-wide picture in the DOCX
+CHART_DPI = 150
+PNG_METADATA = {"Software": None}    # drop matplotlib's creator tag from the PNG
+
+# Short service names for chart labels
+SERVICE_ALIASES = {
+  "Amazon Elastic Compute Cloud - Compute": "EC2",
+  "Amazon Simple Storage Service": "S3",
+  "Amazon Relational Database Service": "RDS",
+  "Amazon Elastic Container Service": "ECS",
+  "Amazon Elastic Kubernetes Service": "EKS",
+  "Tax": "Tax",
+}
+
+# EC2 size ladder (smallest -> largest) used for rightsizing
+SIZE_ORDER = ("nano","micro","small","medium","large","xlarge","2xlarge","3xlarge","4xlarge","6xlarge","8xlarge","12xlarge","16xlarge","24xlarge","32xlarge","metal")
+SIZE_IDX = {s: i for i, s in enumerate(SIZE_ORDER)}
+
+# Rightsizing classes, indexed by class id: reason text and number of sizes to step down
+RS_REASONS = np.array(["Insufficient metrics (retain)", "CPU<5% (downsize 2)", "CPU 5–20% (downsize 1)", "CPU≥20% (retain)"], dtype=object)
+RS_STEPS = np.array([0, 2, 1, 0])
+RS_CPU_EDGES = np.array([5.0, 20.0])    # CPUAvg7d band edges for classes 1 | 2 | 3
+RS_MIN_SAMPLES = 12                      # fewer datapoints -> class 0 (insufficient metrics)
+
+# Route 53 record types flagged when a literal (non-alias) record has TTL < 300s
+LOWTTL_TYPES = frozenset(("A", "AAAA", "CNAME"))
+
+# Shared pool for per-file reads (default min(32, cpus+4) workers, started lazily).
+# Only leaf tasks run here, never work that submits back to it.
+IO_POOL = ThreadPoolExecutor(thread_name_prefix="audit-io")
+
+def slurp(path: Path):
+    """Read a whole file with one open/fstat/read (Path.read_bytes on non-POSIX)."""
+    if os.name != "posix":
+        return Path(path).read_bytes()
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+
 def load_json(path: Path):
+    """Parse a JSON file (None if missing/invalid). Small files are memoised: treat results as read-only."""
+    path = os.path.abspath(path)
     try:
-        with open(path, "r") as f:
-            return json.load(f)
-    except Exception:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):    # never open dirs/FIFOs (a FIFO would block the read)
         return None
+    if st.st_size > JSON_MMAP_MIN_BYTES:    # not memoised: would pin the parsed pack for the whole run
+        return parse_json_file(path, mapped=JSON_MMAP_OK)
+    return load_json_cached(path, st.st_mtime_ns)
+
+def loads_mmap(path: str):
+    """Parse a large JSON file straight from a read-only mapping (no bytes copy of the file)."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as buf:
+        return jsonlib.loads(buf)
+
+def parse_json_file(path: str, mapped: bool=False):
+    try:
+        return loads_mmap(path) if mapped else jsonlib.loads(slurp(path))
+    except (ValueError, OSError):    # decode errors of orjson/ujson/json all derive from ValueError
+        return None
+
+@lru_cache(maxsize=256)
+def load_json_cached(path: str, mtime: int):
+    # mtime is only part of the cache key, so a rewritten file is parsed again
+    return parse_json_file(path)
+
+def load_many(paths):
+    """Load several JSON files concurrently on IO_POOL; returns (path, data) pairs in input order."""
+    paths = list(paths)
+    return list(zip(paths, IO_POOL.map(load_json, paths)))
+
+# Column names for array-shaped (--query '[...]') CLI output, by position; None skips a field
+EC2_COLS = ("InstanceId", "InstanceType", "State", "AZ", "LaunchTime")
+EBS_COLS = ("VolumeId", "Size", "VolumeType", "State", "InstanceId", "Encrypted", "CreateTime")
+RDS_COLS = ("DBInstanceIdentifier", None, "DBInstanceClass")
+
+def records_to_df(data, cols, flatten: bool=True):
+    """DataFrame from either a list of dicts or a list of positional rows.
+
+    Positional rows shorter than cols are dropped; with flatten, rows may be nested one
+    level deep (e.g. grouped per reservation).
+    """
+    if not isinstance(data, list):
+        return pd.DataFrame()
+    if data and isinstance(data[0], dict):
+        return pd.DataFrame(data)
+    if flatten:
+        data = [x for r in data for x in (r if isinstance(r, list) else [r])]
+    return pd.DataFrame([
+        {c: rec[i] for i, c in enumerate(cols) if c}
+        for rec in data if isinstance(rec, list) and len(rec) >= len(cols)
+    ])
+
+def arrow_dtypes(df: pd.DataFrame):
+    """Arrow-backed columns (string[pyarrow], nullable int/float/bool) when pyarrow is installed."""
+    # mixed-type object columns (Tags, nested dicts) are left as object by convert_dtypes
+    return df.convert_dtypes(dtype_backend="pyarrow") if PYARROW_OK and not df.empty else df
+
+def to_float(v, default: float=0.0):
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return default
+
+# Cost data as the report reads it: dashboard scalars + top-5 chart rows + the full frame
+CostSummary = namedtuple("CostSummary", "top_service top_cost top5 df")
+
+def cost_summary(df: pd.DataFrame):
+    """Summarise a Service/CostUSD frame that is already sorted by cost, descending."""
+    if df.empty:
+        return CostSummary("N/A", 0.0, df, df)
+    return CostSummary(df["Service"].iat[0], float(df["CostUSD"].iat[0]), df.iloc[:5], df)
+
+def scan_audit_dir(audit_dir: Path):
+    """List the audit pack in one os.scandir pass: every *.json entry plus the per-resource file groups."""
+    files = {"json": [], "cpu": [], "s3": [], "r53": []}
+    with os.scandir(audit_dir) as it:
+        for e in it:
+            n = e.name
+            if not n.endswith(".json"):
+                continue
+            files["json"].append(e)
+            if n.startswith("cpu_"):
+                files["cpu"].append(Path(e.path))
+            elif n.startswith("s3-") and n.endswith("-size.json") and len(n) > 12:    # s3-*-size.json
+                files["s3"].append(Path(e.path))
+            elif n.startswith("route53-records-"):
+                files["r53"].append(Path(e.path))
+    return files
 
 def load_cost_by_service(audit_dir: Path):
     p = audit_dir / "cost-by-service.json"
     data = load_json(p)
-    rows = []
+    svcs, amts = [], []
     if data:
         groups = (data or {}).get("ResultsByTime", [{}])[0].get("Groups", [])
         for g in groups:
-            svc = g.get("Keys", ["Unknown"])[0]
-            amt = g.get("Metrics", {}).get("UnblendedCost", {}).get("Amount", "0") or "0"
-            try:
-                val = float(amt)
-            except Exception:
-                try:
-                    val = float(amt.replace("E","e"))
-                except Exception:
-                    val = 0.0
-            rows.append({"Service": svc, "CostUSD": val})
-    return pd.DataFrame(rows).sort_values("CostUSD", ascending=False)
-
-def load_ec2(audit_dir: Path):
+            svcs.append(g.get("Keys", ["Unknown"])[0])
+            amts.append(g.get("Metrics", {}).get("UnblendedCost", {}).get("Amount", "0") or "0")
+    try:
+        # one C-level parse for the whole column (float() syntax, so "1.2E5" is fine)
+        costs = np.asarray(amts, dtype=np.float64)
+    except (TypeError, ValueError):
+        costs = np.array([to_float(a) for a in amts], dtype=np.float64)
+    order = np.argsort(-costs, kind="stable")    # descending; ties keep input order
+    return cost_summary(pd.DataFrame({"Service": np.asarray(svcs, dtype=object)[order], "CostUSD": costs[order]}))
+
+def load_ec2(audit_dir: Path, cpu_files=None):
     p = audit_dir / "ec2-instances.json"
     data = load_json(p)
     if not data:
         return pd.DataFrame(), pd.DataFrame()
-    # object-shape vs array-shape tolerant
-    if isinstance(data, list) and data and isinstance(data[0], dict):
-        ec2 = pd.DataFrame(data)
-        if "State" in ec2.columns and isinstance(ec2.iloc[0]["State"], dict):
-            ec2["State"] = ec2["State"].apply(lambda s: s.get("Name") if isinstance(s, dict) else s)
-    else:
-        rows = []
-        arr = data if isinstance(data, list) else []
-        flat = []
-        for r in arr:
-            if isinstance(r, list): flat.extend(r)
-            else: flat.append(r)
-        for rec in flat:
-            if isinstance(rec, list) and len(rec) >= 5:
-                rows.append({
-                    "InstanceId": rec[0], "InstanceType": rec[1], "State": rec[2],
-                    "AZ": rec[3], "LaunchTime": rec[4]
-                })
-        ec2 = pd.DataFrame(rows)
-    # CPU metrics
-    cpu_rows = []
-    for pth in audit_dir.glob("cpu_*.json"):
-        d = load_json(pth)
+    if cpu_files is None:
+        cpu_files = scan_audit_dir(audit_dir)["cpu"]
+    ec2 = records_to_df(data, EC2_COLS)
+    if "State" in ec2.columns and isinstance(ec2["State"].iat[0], dict):
+        ec2["State"] = [s.get("Name") if type(s) is dict else s for s in ec2["State"]]
+    # CPU metrics: one contiguous array of all datapoints, reduced per instance segment
+    seen, series = [], []
+    for pth, d in load_many(cpu_files):
         if not d:
             continue
-        dps = d.get("Datapoints", [])
-        avgs = [dp.get("Average") for dp in dps if "Average" in dp]
-        inst = pth.stem.replace("cpu_","")
-        if avgs:
-            avg = float(np.mean(avgs))
-            p95 = float(np.percentile(avgs, 95)) if len(avgs) > 1 else avg
-            samples = len(avgs)
-        else:
-            avg = None; p95=None; samples = 0
-        cpu_rows.append({"InstanceId": inst, "CPUAvg7d": avg, "CPU95p7d": p95, "Samples": samples})
-    cpu = pd.DataFrame(cpu_rows)
-    ec2m = ec2.merge(cpu, on="InstanceId", how="left") if not ec2.empty else pd.DataFrame()
-    return ec2, ec2m
+        seen.append(pth.stem.replace("cpu_",""))
+        series.append(np.fromiter((dp["Average"] for dp in d.get("Datapoints", []) if "Average" in dp), dtype=np.float64))
+    vals = np.concatenate(series) if series else np.empty(0)
+    counts = np.array([a.size for a in series], dtype=np.int64)
+    avg = np.full(len(seen), np.nan)
+    p95 = np.full(len(seen), np.nan)    # instances with an empty series keep NaN metrics, 0 samples
+    if vals.size:
+        has = counts > 0
+        n = counts[has]
+        starts = (np.cumsum(counts) - counts)[has]
+        avg[has] = np.add.reduceat(vals, starts) / n
+        # p95 with linear interpolation (as np.percentile) on values sorted within each segment
+        srt = vals[np.lexsort((vals, np.repeat(np.arange(len(seen)), counts)))]
+        pos = 0.95 * (n - 1)
+        lo = pos.astype(np.int64)
+        hi = np.minimum(lo + 1, n - 1)
+        p95[has] = srt[starts + lo] + (srt[starts + hi] - srt[starts + lo]) * (pos - lo)
+    cpu = pd.DataFrame({"InstanceId": seen, "CPUAvg7d": avg, "CPU95p7d": p95, "Samples": counts})
+    if ec2.empty:
+        ec2m = pd.DataFrame()
+    elif "InstanceId" in ec2.columns:
+        ec2m = ec2.merge(cpu, on="InstanceId", how="left")
+    else:    # no ids to match cpu_<id>.json against: every instance lacks metrics
+        ec2m = ec2.assign(CPUAvg7d=np.nan, CPU95p7d=np.nan, Samples=0)
+    return arrow_dtypes(ec2), arrow_dtypes(ec2m)
 
 def load_ebs(audit_dir: Path):
     p = audit_dir / "ebs-volumes.json"
     data = load_json(p)
     if not data: return pd.DataFrame()
-    if isinstance(data, list) and data and isinstance(data[0], dict):
-        return pd.DataFrame(data)
-    rows=[]; arr = data if isinstance(data, list) else []
-    flat=[]
-    for r in arr:
-        if isinstance(r, list): flat.extend(r)
-        else: flat.append(r)
-    for rec in flat:
-        if isinstance(rec, list) and len(rec)>=7:
-            rows.append({
-                "VolumeId": rec[0], "Size": rec[1], "VolumeType": rec[2], "State": rec[3],
-                "InstanceId": rec[4], "Encrypted": rec[5], "CreateTime": rec[6]
-            })
-    return pd.DataFrame(rows)
-
-def load_s3_sizes(audit_dir: Path):
-    rows=[]
-    for p in audit_dir.glob("s3-*-size.json"):
-        d = load_json(p);
+    return arrow_dtypes(records_to_df(data, EBS_COLS))
+
+def load_s3_sizes(audit_dir: Path, s3_files=None):
+    """Bucket / 3-day average size in GiB, largest first."""
+    paths = sorted(scan_audit_dir(audit_dir)["s3"] if s3_files is None else s3_files)
+    buckets = np.empty(len(paths), dtype=object)
+    gib = np.zeros(len(paths))
+    n = 0
+    for p, d in load_many(paths):
         if not d: continue
-        dps = d.get("Datapoints", [])
-        avgs = [dp.get("Average") for dp in dps if "Average" in dp]
-        avg_bytes = float(np.mean(avgs)) if avgs else 0.0
-        bucket = p.name.replace("s3-","").replace("-size.json","")
-        rows.append({"Bucket": bucket, "AvgGiB3d": avg_bytes/1024/1024/1024})
-    return pd.DataFrame(rows).sort_values("AvgGiB3d", ascending=False)
+        # a handful of daily datapoints per bucket: plain Python beats NumPy dispatch here
+        avgs = [dp["Average"] for dp in d.get("Datapoints", []) if "Average" in dp]
+        buckets[n] = p.name[3:-10]    # s3-<bucket>-size.json
+        gib[n] = (sum(avgs) / len(avgs) if avgs else 0.0) / 1024**3
+        n += 1
+    order = np.argsort(-gib[:n], kind="stable")
+    return pd.DataFrame({"Bucket": buckets[:n][order], "AvgGiB3d": gib[:n][order]})
 
 def load_misc(audit_dir: Path):
     rds = load_json(audit_dir / "rds-instances.json")
-    if isinstance(rds, list) and rds and isinstance(rds[0], dict):
-        rds_df = pd.DataFrame(rds)
-    elif isinstance(rds, list):
-        rows=[]
-        for rec in rds:
-            if isinstance(rec, list) and len(rec)>=3:
-                rows.append({"DBInstanceIdentifier": rec[0], "DBInstanceClass": rec[2]})
-        rds_df = pd.DataFrame(rows)
-    else:
-        rds_df = pd.DataFrame()
+    rds_df = arrow_dtypes(records_to_df(rds, RDS_COLS, flatten=False))
     elbv2 = load_json(audit_dir / "loadbalancers.json") or {}
     natgw = load_json(audit_dir / "nat-gateways.json") or {}
     tags  = load_json(audit_dir / "tags.json") or {}
@@ -160,8 +296,53 @@ def load_misc(audit_dir: Path):
     tag_count = len(tags.get("ResourceTagMappingList", []))
     return rds_df, lb_total, nat_total, tag_count
 
-def load_route53_eip(audit_dir: Path):
+def iter_rrsets(path: Path):
+    """Yield a zone's ResourceRecordSets one by one; large zones are streamed with ijson when available."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return
+    if not stat.S_ISREG(st.st_mode):    # never open dirs/FIFOs (a FIFO would block the read)
+        return
+    # ijson is ~3x slower than a full orjson parse: only worth it once memory is the concern
+    if not IJSON_OK or st.st_size <= JSON_MMAP_MIN_BYTES:
+        yield from (load_json(path) or {}).get("ResourceRecordSets", [])
+        return
+    try:
+        with open(path, "rb") as f:
+            yield from ijson.items(f, "ResourceRecordSets.item")
+    except (OSError, ijson.JSONError):
+        return
+
+def scan_route53_zone(path: Path):
+    """Return (duplicate-target rows, low-TTL rows) for one route53-records-<zone>.json."""
+    zone_id = path.stem.replace("route53-records-", "")
+    low_ttl = []
+    target_map = defaultdict(set)    # target -> distinct record names; only rows that can match are kept
+    for rr in iter_rrsets(path):
+        g = rr.get
+        rtype = g("Type", "")
+        if rtype in LOWTTL_TYPES:
+            ttl = g("TTL")
+            if isinstance(ttl, int) and ttl < 300 and not g("AliasTarget"):
+                low_ttl.append((zone_id, g("Name", ""), rtype, ttl))
+        if rtype == "A":
+            name = g("Name", "")
+            alias = g("AliasTarget")
+            if alias and "DNSName" in alias:
+                target_map[alias["DNSName"].rstrip(".").lower()].add(name)
+            else:
+                for rec in g("ResourceRecords", []):
+                    v = rec.get("Value")
+                    if v:
+                        target_map[v].add(name)
+    dupes = [(zone_id, target, ", ".join(sorted(names))) for target, names in target_map.items() if len(names) > 1]
+    return dupes, low_ttl
+
+def load_route53_eip(audit_dir: Path, r53_files=None):
     """Load Route53 and Elastic IP related audit data and return summary dict."""
+    if r53_files is None:
+        r53_files = scan_audit_dir(audit_dir)["r53"]
     r53_cost = load_json(audit_dir / "route53-cost.json")
     eip_cost = load_json(audit_dir / "eip-cost.json")
     zones    = load_json(audit_dir / "route53-zones.json")
@@ -186,32 +367,11 @@ def load_route53_eip(audit_dir: Path):
         if ("InstanceId" not in e and "NetworkInterfaceId" not in e and "AssociationId" not in e)
     )
 
-    # detect duplicate targets and low TTLs
+    # detect duplicate targets and low TTLs (one zone file per worker)
     dupes, low_ttl = [], []
-    for p in audit_dir.glob("route53-records-*.json"):
-        d = load_json(p) or {}
-        rrsets = d.get("ResourceRecordSets", [])
-        zone_id = p.stem.replace("route53-records-", "")
-        target_map = {}
-        for rr in rrsets:
-            rtype = rr.get("Type", "")
-            name  = rr.get("Name", "")
-            alias = rr.get("AliasTarget")
-            ttl   = rr.get("TTL")
-            if rtype in ("A", "AAAA", "CNAME") and not alias and isinstance(ttl, int) and ttl < 300:
-                low_ttl.append({"ZoneId": zone_id, "Name": name, "Type": rtype, "TTL": ttl})
-            if rtype == "A":
-                if alias and "DNSName" in alias:
-                    target = alias["DNSName"].rstrip(".").lower()
-                    target_map.setdefault(target, []).append(name)
-                else:
-                    for rec in rr.get("ResourceRecords", []):
-                        v = rec.get("Value")
-                        if v:
-                            target_map.setdefault(v, []).append(name)
-        for target, names in target_map.items():
-            if len(set(names)) > 1:
-                dupes.append({"ZoneId": zone_id, "Target": target, "Names": ", ".join(sorted(set(names)))})
+    for zone_dupes, zone_low_ttl in IO_POOL.map(scan_route53_zone, r53_files):
+        dupes.extend(zone_dupes)
+        low_ttl.extend(zone_low_ttl)
 
     # return unified dict
     return {
@@ -221,88 +381,222 @@ def load_route53_eip(audit_dir: Path):
         "health_checks": hc_count,
         "eips": eip_total,
         "eips_unattached": eip_unattached,
-        "dupes": pd.DataFrame(dupes),
-        "low_ttl": pd.DataFrame(low_ttl)
+        "dupes": pd.DataFrame(dupes, columns=["ZoneId", "Target", "Names"]),
+        "low_ttl": pd.DataFrame(low_ttl, columns=["ZoneId", "Name", "Type", "TTL"])
     }
 
-def downsize_type(it, steps):
-    size_order = ["nano","micro","small","medium","large","xlarge","2xlarge","3xlarge","4xlarge","6xlarge","8xlarge","12xlarge","16xlarge","24xlarge","32xlarge","metal"]
+# DataFrames in the loaded audit dict; everything else is a scalar
+AUDIT_FRAMES = ("cost", "ec2", "ec2m", "ebs", "s3sizes", "rds", "dupes", "low_ttl")
+# Part of the cache key: bump whenever a loader's output (columns, values, order) changes
+CACHE_VERSION = 2
+
+def load_audit(audit_dir: Path, files=None):
+    """Run all loaders (independent and I/O-bound, so concurrently) and return one flat dict."""
+    files = files or scan_audit_dir(audit_dir)
+    loaders = {
+        "cost": (load_cost_by_service,), "ec2": (load_ec2, files["cpu"]), "ebs": (load_ebs,),
+        "s3": (load_s3_sizes, files["s3"]), "misc": (load_misc,), "r53eip": (load_route53_eip, files["r53"]),
+    }
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = {pool.submit(fn, audit_dir, *args): key for key, (fn, *args) in loaders.items()}
+        loaded = {futures[f]: f.result() for f in as_completed(futures)}
+    audit = {"cost": loaded["cost"], "ebs": loaded["ebs"], "s3sizes": loaded["s3"]}
+    audit["ec2"], audit["ec2m"] = loaded["ec2"]
+    audit["rds"], audit["lb_total"], audit["nat_total"], audit["tag_count"] = loaded["misc"]
+    audit.update(loaded["r53eip"])
+    return audit
+
+def audit_cache_key(audit_dir: Path, files=None):
+    """Hash of CACHE_VERSION + the JSON inputs (name + mtime); changes when the pack is re-collected."""
+    h = hashlib.sha1(f"v{CACHE_VERSION}".encode())
+    for e in sorted((files or scan_audit_dir(audit_dir))["json"], key=lambda e: e.name):
+        h.update(e.name.encode() + str(e.stat().st_mtime_ns).encode())
+    return h.hexdigest()
+
+def read_cache(audit_dir: Path, key: str):
+    meta = audit_dir / f".cache_{key}_meta.parquet"
+    if not meta.exists():
+        return None
     try:
-        fam, sz = it.split(".",1)
-        if sz not in size_order: return it
-        idx = max(0, size_order.index(sz)-steps)
-        return f"{fam}.{size_order[idx]}"
+        audit = {n: pd.read_parquet(audit_dir / f".cache_{key}_{n}.parquet") for n in AUDIT_FRAMES}
+        audit.update({k: v[0] for k, v in pd.read_parquet(meta).to_dict("list").items()})
+        audit["cost"] = cost_summary(audit["cost"])
     except Exception:
-        return it
+        return None
+    # the report reads the first row of these as the largest; never trust an unsorted cache
+    if not (audit["cost"].df["CostUSD"].is_monotonic_decreasing and audit["s3sizes"]["AvgGiB3d"].is_monotonic_decreasing):
+        return None
+    return audit
 
-def build_report(audit_dir: Path, output_docx: Path, org_name: str, author: str, charts: bool=False):
-    # ---- Load data (expects your original helper functions) ----
-    cost_df = load_cost_by_service(audit_dir)                      # columns: Service, CostUSD
-    ec2_df, ec2m_df = load_ec2(audit_dir)                          # ec2 inventory + metrics summary
-    ebs_df = load_ebs(audit_dir)                                   # volumes
-    s3sizes_df = load_s3_sizes(audit_dir)                          # Bucket, AvgGiB3d
-    rds_df, lb_total, nat_total, tag_count = load_misc(audit_dir)  # rds instances, totals
-    r53eip = load_route53_eip(audit_dir)                           # dicts: {'MonthlyCost', 'Zones', 'HealthChecks'}, {'MonthlyCost','Allocated','Unattached'}
+def write_cache(audit_dir: Path, key: str, audit: dict):
+    try:
+        for old in audit_dir.glob(".cache_*.parquet"):
+            old.unlink(missing_ok=True)
+        for n in AUDIT_FRAMES:
+            df = audit[n].df if n == "cost" else audit[n]
+            df.to_parquet(audit_dir / f".cache_{key}_{n}.parquet", compression="snappy")
+        # meta is written last: its presence marks a complete cache
+        scalars = {k: v for k, v in audit.items() if k not in AUDIT_FRAMES}
+        pd.DataFrame([scalars]).to_parquet(audit_dir / f".cache_{key}_meta.parquet")
+    except Exception as e:
+        for part in audit_dir.glob(f".cache_{key}_*.parquet"):
+            try:
+                part.unlink(missing_ok=True)
+            except OSError:    # read-only pack: leave it, read_cache needs the meta file anyway
+                pass
+        print(f"[WARN] Parquet cache not written: {e}", file=sys.stderr)
+
+def write_parquet_bundle(out_dir: Path, frames: dict):
+    """Write each report DataFrame as <name>.parquet for downstream analytics."""
+    if not PYARROW_OK:
+        print("[WARN] pyarrow not installed; skipping Parquet export", file=sys.stderr)
+        return
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for name, df in frames.items():
+        try:
+            df.to_parquet(out_dir / f"{name}.parquet", compression="zstd", index=False)
+        except Exception as e:
+            print(f"[WARN] {name}.parquet not written: {e}", file=sys.stderr)
+    print(f"[OK] Parquet data written to: {out_dir}")
+
+def downsize_types(types, steps):
+    """Step each instance type down its size ladder: list of types + int array of steps -> list of types."""
+    # split family/size once, then step down the size ladder with integer math
+    parts = [t.partition(".") for t in types]
+    size_idx = np.array([SIZE_IDX.get(sz, -1) for _, _, sz in parts], dtype=int)
+    new_idx = np.maximum(0, size_idx - steps)
+    return [f"{fam}.{SIZE_ORDER[n]}" if i >= 0 else t for (fam, _, _), i, n, t in zip(parts, size_idx, new_idx, types)]
+
+@lru_cache(maxsize=None)
+def chart_figure():
+    """Import matplotlib on the Agg backend (headless, no GUI probing) and return its Figure class."""
+    import matplotlib
+    matplotlib.use("Agg")
+    matplotlib.rcParams["figure.dpi"] = 100
+    from matplotlib.figure import Figure
+    return Figure
+
+def render_top5_chart(top5, png: Path):
+    """Top 5 Services pie chart."""
+    fig = chart_figure()(figsize=(6,4))
+    ax = fig.add_subplot()
+    t5_labels = [SERVICE_ALIASES.get(s, s.replace("Amazon ", "").split(" - ")[0]) for s in top5["Service"]]
+    ax.pie(
+        top5["CostUSD"],
+        labels=top5["Service"],
+        #labels=t5_labels,
+        autopct=lambda p: f"${p*top5['CostUSD'].sum()/100:,.0f}",
+        startangle=140
+    )
+    ax.set_title("Top 5 Services by Cost (USD)")
+    # bbox_inches='tight' already fits the outside labels; tight_layout would re-render for nothing
+    fig.savefig(png, dpi=CHART_DPI, bbox_inches='tight', metadata=PNG_METADATA)
+    return png
+
+def render_savings_chart(png: Path):
+    """Projected savings bar chart."""
+    # simple static model for projected savings (can wire to your computed estimates later)
+    cats = ["EC2 Rightsizing","EBS Optimization","S3 Lifecycle","Networking","Governance"]
+    vals = [22, 8, 6, 4, 2]
+    fig = chart_figure()(figsize=(6,4))
+    ax = fig.add_subplot()
+    ax.bar(cats, vals)
+    ax.set_ylabel("Projected Savings (%)")
+    ax.set_title("Projected Savings by Optimization Category")
+    ax.tick_params(axis="x", labelrotation=20)
+    for lbl in ax.get_xticklabels(): lbl.set_horizontalalignment("right")
+    fig.tight_layout()
+    fig.savefig(png, dpi=CHART_DPI, metadata=PNG_METADATA)
+    return png
+
+def append_rows(tbl, rows):
+    """Append rows of cell text to a table with a single parse_xml call (no per-cell python-docx edits)."""
+    tc_prs = []
+    for gc in tbl._tbl.tblGrid.gridCol_lst:
+        w = gc.get(qn("w:w"))
+        tc_prs.append(f'<w:tcPr><w:tcW w:type="dxa" w:w="{w}"/></w:tcPr>' if w else "")
+    trs = "".join(
+        "<w:tr>" + "".join(
+            f'<w:tc>{pr}<w:p><w:r><w:t xml:space="preserve">{escape(text)}</w:t></w:r></w:p></w:tc>'
+            for pr, text in zip(tc_prs, row)
+        ) + "</w:tr>"
+        for row in rows
+    )
+    tbl._tbl.extend(parse_xml(f"<w:tbl {nsdecls('w')}>{trs}</w:tbl>").findall(qn("w:tr")))
+
+def classify_cpu(cpu, samples):
+    """Rightsizing class id per instance (index into RS_REASONS / RS_STEPS)."""
+    # one binary search over the band edges instead of nested np.where; NaN sorts past the last edge
+    cls = np.searchsorted(RS_CPU_EDGES, cpu, side="right").astype(np.int8) + 1
+    cls[np.isnan(cpu) | (samples < RS_MIN_SAMPLES)] = 0
+    return cls
+
+def build_report(audit_dir: Path, output_docx: Path, org_name: str, author: str, charts: bool=False, cache: bool=False, emit_parquet: bool=False):
+    # ---- Load data (from the Parquet cache when the audit pack is unchanged) ----
+    files = scan_audit_dir(audit_dir)
+    if cache and not PYARROW_OK:
+        print("[WARN] pyarrow not installed; --cache ignored", file=sys.stderr)
+    cache_key = audit_cache_key(audit_dir, files) if cache and PYARROW_OK else None
+    audit = read_cache(audit_dir, cache_key) if cache_key else None
+    if audit is None:
+        audit = load_audit(audit_dir, files)
+        if cache_key:
+            write_cache(audit_dir, cache_key, audit)
+    else:
+        print(f"[INFO] Using cached audit data: {audit_dir}/.cache_{cache_key}_*.parquet")
+    cost = audit["cost"]                                           # CostSummary; cost.df columns: Service, CostUSD
+    ec2_df, ec2m_df = audit["ec2"], audit["ec2m"]                  # ec2 inventory + metrics summary
+    ebs_df = audit["ebs"]                                          # volumes
+    s3sizes_df = audit["s3sizes"]                                  # Bucket, AvgGiB3d
+    rds_df = audit["rds"]                                          # rds instances
+    lb_total, nat_total, tag_count = audit["lb_total"], audit["nat_total"], audit["tag_count"]
+    r53eip = audit                                                 # route53/eip keys: r53_cost, zones, eips, dupes, ...
 
     # ---- Compute quick insights ----
-    top_service = cost_df.iloc[0]["Service"] if not cost_df.empty else "N/A"
-    top_cost = float(cost_df.iloc[0]["CostUSD"]) if not cost_df.empty else 0.0
+    top_service, top_cost = cost.top_service, cost.top_cost
 
     ec2_total = len(ec2_df) if not ec2_df.empty else 0
-    ec2_running = int((ec2_df["State"].astype(str)=="running").sum()) if not ec2_df.empty and "State" in ec2_df.columns else 0
+    ec2_running = int((ec2_df["State"]=="running").sum()) if not ec2_df.empty and "State" in ec2_df.columns else 0
 
-    # rightsizing candidates & table rows
-    rs_rows = []
+    # rightsizing candidates & table rows (classified column-wise over the running fleet)
+    rs_cols = ["InstanceId","CurrentType","CPUAvg7d","CPU95p7d","Samples","RecommendedType","Reason"]
+    rs_df = pd.DataFrame(columns=rs_cols)
     idle_candidates = 0
     if not ec2m_df.empty:
-        mask_running = (ec2m_df["State"].astype(str)=="running") if "State" in ec2m_df.columns else ec2m_df.index==ec2m_df.index
-        for _, r in ec2m_df[mask_running].iterrows():
-            cur = str(r.get("InstanceType",""))
-            cpu = r.get("CPUAvg7d")
-            p95 = r.get("CPU95p7d")
-            samples = int(r.get("Samples") or 0)
-            if pd.isna(cpu) or samples < 12:
-                rec, reason = cur, "Insufficient metrics (retain)"
-            elif cpu < 5:
-                rec, reason = downsize_type(cur,2), "CPU<5% (downsize 2)"
-                idle_candidates += 1
-            elif cpu < 20:
-                rec, reason = downsize_type(cur,1), "CPU 5–20% (downsize 1)"
-            else:
-                rec, reason = cur, "CPU≥20% (retain)"
-            rs_rows.append([
-                r.get("InstanceId",""),
-                cur,
-                None if pd.isna(cpu) else float(cpu),
-                None if pd.isna(p95) else float(p95),
-                samples,
-                rec,
-                reason
-            ])
-    rs_df = pd.DataFrame(rs_rows, columns=[
-        "InstanceId","CurrentType","CPUAvg7d","CPU95p7d","Samples","RecommendedType","Reason"
-    ])
+        mask_running = ec2m_df["State"].isin(["running"]) if "State" in ec2m_df.columns else ec2m_df.index==ec2m_df.index
+        run = ec2m_df[mask_running]
+        blank = pd.Series("", index=run.index)    # inventories may omit either field
+        cur = [str(t) for t in run.get("InstanceType", blank)]
+        cpu = run["CPUAvg7d"].to_numpy(dtype=float, na_value=np.nan)
+        p95 = run["CPU95p7d"].to_numpy(dtype=float, na_value=np.nan)
+        samples = run["Samples"].fillna(0).to_numpy(dtype=int)
+        cls = classify_cpu(cpu, samples)    # 0: insufficient metrics, 1: CPU<5%, 2: CPU 5–20%, 3: CPU≥20%
+        idle_candidates = int((cls == 1).sum())
+        rec = downsize_types(cur, RS_STEPS[cls])
+        rs_df = pd.DataFrame({
+            "InstanceId": run.get("InstanceId", blank).to_numpy(), "CurrentType": cur,
+            "CPUAvg7d": cpu, "CPU95p7d": p95, "Samples": samples,
+            "RecommendedType": rec, "Reason": RS_REASONS[cls],
+        }, columns=rs_cols)
 
     # storage signals
     ebs_unattached = 0
     ebs_gp2 = 0
     if not ebs_df.empty:
         if "InstanceId" in ebs_df.columns:
-            ebs_unattached = int(((ebs_df["InstanceId"].isna()) | (ebs_df["InstanceId"].astype(str) == "")).sum())
+            # missing ids become "" during the to_numpy copy, so one comparison covers both cases
+            ebs_unattached = int((ebs_df["InstanceId"].to_numpy(dtype=object, na_value="") == "").sum())
 
         if "VolumeType" in ebs_df.columns:
-            ebs_gp2 = int((ebs_df["VolumeType"].astype(str)=="gp2").sum())
+            ebs_gp2 = int((ebs_df["VolumeType"]=="gp2").sum())
 
     largest_bucket = "N/A"
     largest_gib = 0.0
-    if not s3sizes_df.empty:
-        s3sizes_df = s3sizes_df.sort_values("AvgGiB3d", ascending=False)
-        largest_bucket = s3sizes_df.iloc[0]["Bucket"]
-        largest_gib = float(s3sizes_df.iloc[0]["AvgGiB3d"])
-
-    # ---- Route53 / EIP (single combined dict) ----
-    r53eip = load_route53_eip(audit_dir)
+    if not s3sizes_df.empty:    # already sorted largest first
+        largest_bucket = s3sizes_df["Bucket"].iat[0]
+        largest_gib = float(s3sizes_df["AvgGiB3d"].iat[0])
 
+    # ---- Route53 / EIP (single combined dict, already loaded above) ----
     r53_cost   = float(r53eip.get("r53_cost", 0.0))
     r53_zones  = int(r53eip.get("zones", 0))
     r53_health = int(r53eip.get("health_checks", 0))
@@ -317,49 +611,25 @@ def build_report(audit_dir: Path, output_docx: Path, org_name: str, author: str,
 
     # ---- Charts (Top 5 + Projected Savings) ----
     charts_dir = output_docx.parent / "charts"
-    charts_dir.mkdir(exist_ok=True)
     top5_png = charts_dir / "top5_services_cost.png"
     proj_png = charts_dir / "projected_savings.png"
+    rendered = set()    # only charts drawn in this run are embedded (never a stale PNG from an earlier one)
 
-    # Top 5 Services Pie Chart
-    service_aliases = {
-      "Amazon Elastic Compute Cloud - Compute": "EC2",
-      "Amazon Simple Storage Service": "S3",
-      "Amazon Relational Database Service": "RDS",
-      "Amazon Elastic Container Service": "ECS",
-      "Amazon Elastic Kubernetes Service": "EKS",
-      "Tax": "Tax",
-    }
-
     if charts and MATPLOTLIB_OK:
-        top5 = cost_df.head(5)
-        if not top5.empty:
-            plt.figure(figsize=(6,4))
-            t5_labels = [service_aliases.get(s, s.replace("Amazon ", "").split(" - ")[0]) for s in top5["Service"]]
-            plt.pie(
-                top5["CostUSD"],
-                labels=top5["Service"],
-                #labels=t5_labels,
-                autopct=lambda p: f"${p*top5['CostUSD'].sum()/100:,.0f}",
-                startangle=140
-            )
-            plt.title("Top 5 Services by Cost (USD)")
-            plt.tight_layout(pad=1.5)
-            plt.savefig(top5_png, dpi=200, bbox_inches='tight')
-            plt.close()
-            print(f"[INFO] Chart generated: {top5_png}")
-
-        # simple static model for projected savings (can wire to your computed estimates later)
-        cats = ["EC2 Rightsizing","EBS Optimization","S3 Lifecycle","Networking","Governance"]
-        vals = [22, 8, 6, 4, 2]
-        plt.figure(figsize=(6,4))
-        plt.bar(cats, vals)
-        plt.ylabel("Projected Savings (%)")
-        plt.title("Projected Savings by Optimization Category")
-        plt.xticks(rotation=20, ha="right")
-        plt.tight_layout()
-        plt.savefig(proj_png, dpi=200); plt.close()
-        print(f"[INFO] Chart generated: {proj_png}")
+        try:
+            chart_figure()    # first real import: an installed-but-broken matplotlib must not sink the report
+        except Exception as e:
+            print(f"[WARN] matplotlib could not be imported; skipping charts: {e}", file=sys.stderr)
+            charts = False
+    if charts and MATPLOTLIB_OK:
+        charts_dir.mkdir(parents=True, exist_ok=True)
+        # render both figures concurrently; results are awaited before the DOCX build
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            jobs = [pool.submit(render_top5_chart, cost.top5, top5_png)] if not cost.top5.empty else []
+            jobs.append(pool.submit(render_savings_chart, proj_png))
+            for job in jobs:
+                rendered.add(job.result())
+                print(f"[INFO] Chart generated: {job.result()}")
 
     # ---- DOCX build ----
     doc = Document()
@@ -384,7 +654,7 @@ def build_report(audit_dir: Path, output_docx: Path, org_name: str, author: str,
     dash.cell(4,0).text = "Networking & Tagging"; dash.cell(4,1).text = f"NAT GWs: {nat_total} | LBs: {lb_total} | Tagged: {tag_count}"
 
     # Top 5 chart right after Key Insights
-    if charts and MATPLOTLIB_OK and top5_png.exists():
+    if top5_png in rendered:
         doc.add_paragraph()
         doc.add_heading("Top 5 Services by Cost (USD)", level=2)
         p = doc.add_paragraph(); p.alignment = WD_ALIGN_PARAGRAPH.CENTER
@@ -415,15 +685,11 @@ def build_report(audit_dir: Path, output_docx: Path, org_name: str, author: str,
         tbl = doc.add_table(rows=1, cols=len(rs_df.columns)); tbl.style = "Light Grid"
         hdr_cells = tbl.rows[0].cells
         for i, col in enumerate(rs_df.columns): hdr_cells[i].text = col
-        for _, row in rs_df.iterrows():
-            cells = tbl.add_row().cells
-            cells[0].text = str(row["InstanceId"])
-            cells[1].text = str(row["CurrentType"])
-            cells[2].text = "" if pd.isna(row["CPUAvg7d"]) else f"{row['CPUAvg7d']:.3f}"
-            cells[3].text = "" if pd.isna(row["CPU95p7d"]) else f"{row['CPU95p7d']:.3f}"
-            cells[4].text = str(row["Samples"])
-            cells[5].text = str(row["RecommendedType"])
-            cells[6].text = str(row["Reason"])
+        append_rows(tbl, (
+            (str(inst), str(cur), "" if pd.isna(cpu) else f"{cpu:.3f}", "" if pd.isna(p95) else f"{p95:.3f}",
+             str(samples), str(rec), str(reason))
+            for inst, cur, cpu, p95, samples, rec, reason in rs_df.itertuples(index=False, name=None)
+        ))
     else:
         doc.add_paragraph("No EC2 instances or insufficient metrics for rightsizing analysis.")
 
@@ -461,24 +727,15 @@ def build_report(audit_dir: Path, output_docx: Path, org_name: str, author: str,
         f"Elastic IP cost (reported): ${eip_cost:.2f}/month | Allocated: {eip_alloc} | Unattached: {eip_unatt}"
     )
     tbl = doc.add_table(rows=1, cols=3); tbl.style = "Light Grid"
-    tbl.rows[0].cells[0].text = "Area"
-    tbl.rows[0].cells[1].text = "Findings"
-    tbl.rows[0].cells[2].text = "Recommended Action"
-    # Row: Route 53
-    r = tbl.add_row().cells
-    r[0].text = "Route 53"
-    r[1].text = "Multiple A-record names pointing to same targets; low TTLs detected"
-    r[2].text = "Consolidate via ALB alias; increase TTL to 300–900s; remove stale records"
-    # Row: Elastic IPs
-    r = tbl.add_row().cells
-    r[0].text = "Elastic IPs"
-    r[1].text = f"{eip_alloc} total, {eip_unatt} unattached"
-    r[2].text = "Release unattached EIP; prefer ALB/NLB DNS endpoints over static EIPs"
-    # Row: Health Checks
-    r = tbl.add_row().cells
-    r[0].text = "Health Checks"
-    r[1].text = f"{r53_health} active Route 53 health checks"
-    r[2].text = "Use ALB/NLB target health unless needed for external endpoints"
+    for i, h in enumerate(("Area", "Findings", "Recommended Action")): tbl.rows[0].cells[i].text = h
+    append_rows(tbl, [
+        ("Route 53", "Multiple A-record names pointing to same targets; low TTLs detected",
+         "Consolidate via ALB alias; increase TTL to 300–900s; remove stale records"),
+        ("Elastic IPs", f"{eip_alloc} total, {eip_unatt} unattached",
+         "Release unattached EIP; prefer ALB/NLB DNS endpoints over static EIPs"),
+        ("Health Checks", f"{r53_health} active Route 53 health checks",
+         "Use ALB/NLB target health unless needed for external endpoints"),
+    ])
 
     # Governance & Observability
     doc.add_paragraph()
@@ -500,16 +757,11 @@ def build_report(audit_dir: Path, output_docx: Path, org_name: str, author: str,
         ("6","Enforce tagging (Config/SCP)","—","4"),
     ]
     t = doc.add_table(rows=1, cols=4); t.style = "Light Grid"
-    t.rows[0].cells[0].text = "Priority"
-    t.rows[0].cells[1].text = "Action"
-    t.rows[0].cells[2].text = "Target Savings"
-    t.rows[0].cells[3].text = "Effort (hrs)"
-    for pr, act, sav, hrs in plan:
-        c = t.add_row().cells
-        c[0].text, c[1].text, c[2].text, c[3].text = pr, act, sav, hrs
+    for i, h in enumerate(("Priority", "Action", "Target Savings", "Effort (hrs)")): t.rows[0].cells[i].text = h
+    append_rows(t, plan)
 
     # Projected Savings chart right after the plan
-    if charts and MATPLOTLIB_OK and proj_png.exists():
+    if proj_png in rendered:
         doc.add_paragraph()
         doc.add_heading("Projected Savings by Optimization Category", level=2)
         p = doc.add_paragraph(); p.alignment = WD_ALIGN_PARAGRAPH.CENTER
@@ -533,11 +785,20 @@ def build_report(audit_dir: Path, output_docx: Path, org_name: str, author: str,
     doc.save(output_docx)
     print(f"[OK] Report written to: {output_docx}")
 
+    if emit_parquet:
+        write_parquet_bundle(output_docx.parent / "data", {
+            "cost-by-service": cost.df, "ec2-metrics": ec2m_df, "ec2-rightsizing": rs_df,
+            "ebs-volumes": ebs_df, "s3-sizes": s3sizes_df, "rds-instances": rds_df,
+            "route53-dupes": dupes_df, "route53-low-ttl": lowttl_df,
+        })
+
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--input", required=True, help="Path to audit directory")
     ap.add_argument("--output", required=True, help="Path to output .docx file")
     ap.add_argument("--charts", action="store_true", help="Generate and embed PNG charts")
+    ap.add_argument("--cache", action="store_true", help="Cache parsed audit data as Parquet in the audit directory (needs pyarrow)")
+    ap.add_argument("--emit-parquet", action="store_true", help="Also write the report data as Parquet files under <output dir>/data")
     ap.add_argument("--org", default="AWS Cost Optimization Report", help="Organization name for the report")
     ap.add_argument("--author", default="Cloud Architecture", help="Display author's name in the report")
     args = ap.parse_args()
@@ -546,7 +807,7 @@ def main():
     if not audit_dir.exists():
         print(f"[ERR] Input path not found: {audit_dir}", file=sys.stderr)
         sys.exit(1)
-    build_report(audit_dir, output_docx, args.org, args.author, charts=args.charts)
+    build_report(audit_dir, output_docx, args.org, args.author, charts=args.charts, cache=args.cache, emit_parquet=args.emit_parquet)
 
 if __name__ == "__main__":
     main()